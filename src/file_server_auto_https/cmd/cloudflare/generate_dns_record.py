@@ -1,24 +1,17 @@
 """Command for generating DNS records."""
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 import typer
 from rich.console import Console
 from rich.panel import Panel
-from rich.table import Table
-from rich.syntax import Syntax
-
-from ...lib.cloudflare.cloudflare_handler import (
-    CloudflareClient,
-    DNSRecord,
-    DNSRecordSettings,
-    CloudflareError,
-    generate_subdomain
-)
-from ...lib.grab_ip import get_ip
+
+# The Cloudflare client pulls in requests/pydantic; commands import it on demand
+if TYPE_CHECKING:
+    from ...lib.cloudflare.cloudflare_handler import CloudflareError
 
 app = typer.Typer()
 console = Console()
 
-def format_error(error: CloudflareError) -> str:
+def format_error(error: "CloudflareError") -> str:
     """Format CloudflareError for display."""
     message = str(error)
     if error.errors:
@@ -40,6 +33,16 @@ def create(
     ttl: int = typer.Option(1, help="TTL in seconds. Use 1 for automatic.")
 ) -> None:
     """Create a new DNS record for the file server."""
+    from rich.syntax import Syntax
+    from ...lib.cloudflare.cloudflare_handler import (
+        CloudflareClient,
+        CloudflareError,
+        DNSRecord,
+        DNSRecordSettings,
+        generate_subdomain
+    )
+    from ...lib.grab_ip import get_ip
+
     try:
         # Get IP address
         ip_address = ip or get_ip(use_public=use_public_ip)
@@ -87,14 +90,79 @@ def create(
         console.print(Panel(f"[red]Error:[/red] {str(e)}", title="Error"))
         raise typer.Exit(1)
 
+@app.command()
+def bulk_create(
+    count: int = typer.Option(..., min=1, help="Number of random subdomains to create."),
+    ip: Optional[str] = typer.Option(None, help="IP address to use. If not provided, will auto-detect."),
+    use_public_ip: bool = typer.Option(True, help="Use public IP instead of local IP when auto-detecting."),
+    length: int = typer.Option(8, help="Length of the random subdomains."),
+    proxied: bool = typer.Option(True, help="Whether to proxy through Cloudflare."),
+    ttl: int = typer.Option(1, help="TTL in seconds. Use 1 for automatic.")
+) -> None:
+    """Create several random DNS records in one batch."""
+    from rich.table import Table
+    from ...lib.cloudflare.cloudflare_handler import (
+        CloudflareClient,
+        CloudflareError,
+        DNSRecord,
+        DNSRecordSettings,
+        generate_subdomain
+    )
+    from ...lib.grab_ip import get_ip
+
+    try:
+        ip_address = ip or get_ip(use_public=use_public_ip)
+        console.print(Panel(f"Using IP address: {ip_address}", title="Setup"))
+
+        with CloudflareClient() as client:
+            # Validate the shared fields once; copies only swap in the generated name
+            template = DNSRecord(
+                name=f"{generate_subdomain(length)}.{client.config.base_domain}",
+                content=ip_address,
+                proxied=proxied,
+                ttl=ttl,
+                comment="Auto-generated subdomain for file server",
+                settings=DNSRecordSettings(ipv4_only=False, ipv6_only=False)
+            )
+            records = [template] + [
+                template.model_copy(update={"name": f"{generate_subdomain(length)}.{client.config.base_domain}"})
+                for _ in range(count - 1)
+            ]
+            results = client.bulk_create_dns_records(records)
+
+        table = Table(title=f"Created DNS records for {client.config.base_domain}")
+        table.add_column("Name", style="bold")
+        table.add_column("Record ID", style="dim")
+        table.add_column("Status", justify="center")
+
+        failed = 0
+        for record, result in zip(records, results):
+            if isinstance(result, CloudflareError):
+                failed += 1
+                table.add_row(record.name, "", f"[red]{format_error(result)}[/red]")
+            else:
+                table.add_row(record.name, result["result"]["id"], "[green]✓[/green]")
+
+        console.print(table)
+        if failed:
+            raise typer.Exit(1)
+
+    except typer.Exit:
+        raise
+    except Exception as e:
+        console.print(Panel(f"[red]Error:[/red] {str(e)}", title="Error"))
+        raise typer.Exit(1)
+
 @app.command()
 def list_records(
     show_all: bool = typer.Option(False, help="Show all records, not just those created by this tool")
 ) -> None:
     """List DNS records in the zone."""
+    from rich.table import Table
+    from ...lib.cloudflare.cloudflare_handler import CloudflareClient, CloudflareError
+
     try:
         client = CloudflareClient()
-        records = client.list_dns_records()
         
         table = Table(title=f"DNS Records for {client.config.base_domain}")
         table.add_column("ID", style="dim")
@@ -105,7 +173,7 @@ def list_records(
         table.add_column("TTL", justify="right")
         table.add_column("Comment", style="dim")
         
-        for record in records:
+        for record in client.iter_dns_records():
             if show_all or (record.get("comment", "").startswith("Auto-generated subdomain")):
                 table.add_row(
                     record["id"],
@@ -131,6 +199,8 @@ def delete(
     record_id: str = typer.Argument(..., help="ID of the DNS record to delete")
 ) -> None:
     """Delete a DNS record by ID."""
+    from ...lib.cloudflare.cloudflare_handler import CloudflareClient, CloudflareError
+
     try:
         client = CloudflareClient()
         result = client.delete_dns_record(record_id)
@@ -3,17 +3,12 @@ Command module for starting the file server with automatic HTTPS.
 """
 import os
 import signal
-import sys
+import threading
 from pathlib import Path
 from typing import Optional
 
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-
-from ...cloudflare.client import CloudflareClient
-from ...cloudflare.exceptions import CloudflareError
-from ...server.file_server import FileServer, find_free_port
 
 app = typer.Typer()
 console = Console()
@@ -62,24 +57,68 @@ def start(
         "--no-proxy",
         help="Don't proxy through Cloudflare (for local testing)",
     ),
+    reuse_port: bool = typer.Option(
+        False,
+        "--reuse-port",
+        help="Bind with SO_REUSEPORT so several server processes can share the port (threaded server only)",
+    ),
+    workers: Optional[int] = typer.Option(
+        None,
+        "--workers",
+        min=1,
+        help="Handle requests on a fixed pool of this many threads instead of one per connection (threaded server only)",
+    ),
+    asgi: bool = typer.Option(
+        False,
+        "--asgi",
+        help="Serve with uvicorn/Starlette instead of the threaded server (requires the asgi extra)",
+    ),
 ):
     """Start a file server with automatic HTTPS."""
+    if asgi:
+        unsupported = [
+            flag for flag, given in (
+                ("--no-directory-listing", no_directory_listing),
+                ("--reuse-port", reuse_port),
+                ("--workers", workers is not None),
+            ) if given
+        ]
+        if unsupported:
+            console.print(f"[red]{', '.join(unsupported)} cannot be combined with --asgi[/]")
+            raise typer.Exit(1)
+        # Resolved before any DNS record exists, so a missing extra leaves nothing behind
+        try:
+            from ...lib.server.asgi_server import AsgiFileServer
+        except ImportError:
+            console.print("[red]--asgi requires the asgi extra: pip install 'file-server-auto-https[asgi]'[/]")
+            raise typer.Exit(1)
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    # Imported here so `--help` doesn't load the HTTP server and Cloudflare client
+    from ...lib.cloudflare.cloudflare_handler import (
+        CloudflareClient,
+        CloudflareError,
+        DNSRecord,
+        generate_subdomain
+    )
+    from ...lib.grab_ip import get_ip
+    from ...lib.server.file_server import FileServer
+
     # Handle Ctrl+C gracefully
+    stop_event = threading.Event()
+
     def signal_handler(signum, frame):
         console.print("\n[yellow]Shutting down server...[/]")
-        sys.exit(0)
+        stop_event.set()
     
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
-    # Auto-select port if requested
-    if port == 0:
-        port = find_free_port()
-        console.print(f"[green]Selected port: {port}[/]")
-
     # Create DNS record if needed
+    client: Optional[CloudflareClient] = None
     dns_record = None
     if not no_dns:
+        client = CloudflareClient()
         try:
             with Progress(
                 SpinnerColumn(),
@@ -87,8 +126,13 @@ def start(
                 console=console,
             ) as progress:
                 progress.add_task(description="Creating DNS record...", total=None)
-                client = CloudflareClient()
-                dns_record = client.create_dns_record(subdomain)
+                record = DNSRecord(
+                    name=f"{subdomain or generate_subdomain()}.{client.config.base_domain}",
+                    content=get_ip(),
+                    proxied=not no_proxy,
+                    comment="Auto-generated subdomain for file server"
+                )
+                dns_record = client.create_dns_record(record)["result"]
                 console.print(f"[green]Created DNS record: {dns_record['name']}[/]")
         except CloudflareError as e:
             console.print(f"[red]Failed to create DNS record: {e}[/]")
@@ -97,25 +141,32 @@ def start(
                 no_proxy = True
 
     # Start the server
-    server = FileServer(
-        directory=directory,
-        port=port,
-        host=host,
-        enable_directory_listing=not no_directory_listing,
-    )
-
-    # Print server info
-    console.print("\n[bold]Server Configuration:[/]")
-    console.print(f"  Directory: {directory}")
-    console.print(f"  Internal URL: http://{host}:{port}")
-    if dns_record and not no_proxy:
-        console.print(f"  Public URL: https://{dns_record['name']}")
-    console.print("\nPress Ctrl+C to stop the server\n")
+    if asgi:
+        server = AsgiFileServer(directory=directory, port=port, host=host)
+    else:
+        server = FileServer(
+            directory=directory,
+            port=port,
+            host=host,
+            directory_listing=not no_directory_listing,
+            reuse_port=reuse_port,
+            max_workers=workers,
+        )
 
     try:
         with server:
-            # Keep main thread alive
-            signal.pause()
+            # Print server info once bound, so port 0 shows the port the OS picked
+            console.print("\n[bold]Server Configuration:[/]")
+            console.print(f"  Directory: {directory}")
+            console.print(f"  Internal URL: http://{host}:{server.server_port}")
+            if dns_record and not no_proxy:
+                console.print(f"  Public URL: https://{dns_record['name']}")
+            console.print("\nPress Ctrl+C to stop the server\n")
+
+            # Block the main thread until a shutdown signal arrives. Wait in short
+            # slices: an untimed wait never wakes for Ctrl+C on Windows.
+            while not stop_event.wait(0.5):
+                pass
     except KeyboardInterrupt:
         pass
     finally:
@@ -131,6 +182,8 @@ def start(
                     console.print("[green]Cleaned up DNS record[/]")
             except CloudflareError as e:
                 console.print(f"[red]Failed to clean up DNS record: {e}[/]")
+        if client:
+            client.close()
 
 if __name__ == "__main__":
     app() 
\ No newline at end of file
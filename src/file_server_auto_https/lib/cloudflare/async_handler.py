@@ -0,0 +1,168 @@
+"""Asynchronous Cloudflare API handler module."""
+import asyncio
+import sys
+from typing import AsyncIterator, Optional, Dict, List, Sequence, Union
+
+import aiohttp
+import orjson
+
+from .cloudflare_handler import (
+    CloudflareConfig,
+    CloudflareError,
+    DNSRecord,
+    get_cloudflare_config,
+    _BULK_CREATE_CONCURRENCY,
+    _DNS_RECORDS_PAGE_SIZE,
+    _RETRY_TOTAL,
+    _check_result,
+    _filter_unregistered,
+    _record_payload,
+    _retry_delay,
+    _should_retry
+)
+
+try:
+    import aiodns  # noqa: F401  # backs aiohttp.AsyncResolver
+except ImportError:
+    aiodns = None
+
+# c-ares resolution is not supported with the Windows proactor event loop
+_USE_AIODNS = aiodns is not None and sys.platform != "win32"
+
+class AsyncCloudflareClient:
+    """Asynchronous client for interacting with Cloudflare API.
+
+    Requests share one aiohttp session so concurrent calls (e.g. via
+    ``asyncio.gather``) overlap their network I/O and DNS lookups. Rate limits
+    and server errors are retried with the same policy as CloudflareClient.
+    """
+
+    def __init__(
+        self,
+        config: Optional[CloudflareConfig] = None,
+        max_concurrency: int = _BULK_CREATE_CONCURRENCY
+    ):
+        """Initialize the client with config or load from environment.
+
+        Args:
+            config: Cloudflare configuration. Loaded from environment if not provided.
+            max_concurrency: Maximum number of requests in flight at once.
+        """
+        self.config = config or get_cloudflare_config()
+        self.base_url = "https://api.cloudflare.com/client/v4"
+        self.timeout = 10.0
+        self.max_concurrency = max_concurrency
+        self.headers = {
+            "X-Auth-Email": self.config.email,
+            "X-Auth-Key": self.config.api_key,
+            "Content-Type": "application/json"
+        }
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it inside the running event loop."""
+        if self._session is None or self._session.closed:
+            resolver = aiohttp.AsyncResolver() if _USE_AIODNS else aiohttp.ThreadedResolver()
+            connector = aiohttp.TCPConnector(resolver=resolver, limit=self.max_concurrency, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> 'AsyncCloudflareClient':
+        """Return the client for use as an async context manager."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Close the HTTP session when exiting a context."""
+        await self.close()
+
+    async def _handle_response(self, response: aiohttp.ClientResponse) -> Dict:
+        """Handle API response and raise appropriate errors."""
+        try:
+            data = orjson.loads(await response.read())
+        except ValueError:
+            raise CloudflareError(f"Invalid JSON response: {await response.text()}")
+
+        return _check_result(data, response.ok, f"{response.status} {response.reason}")
+
+    async def _request(self, method: str, url: str, **kwargs) -> Dict:
+        """Send a request and handle its response, retrying transient errors."""
+        session = self._get_session()
+        for attempt in range(_RETRY_TOTAL + 1):
+            async with session.request(method, url, **kwargs) as response:
+                if attempt == _RETRY_TOTAL or not _should_retry(method, response.status):
+                    return await self._handle_response(response)
+                delay = _retry_delay(attempt, response.headers.get("Retry-After"))
+            await asyncio.sleep(delay)
+
+    async def create_dns_record(self, record: DNSRecord) -> Dict:
+        """Create a new DNS record."""
+        url = f"{self.base_url}/zones/{self.config.zone_id}/dns_records"
+        return await self._request("POST", url, data=orjson.dumps(_record_payload(record)))
+
+    async def create_dns_records(self, records: Sequence[DNSRecord]) -> List[Union[Dict, CloudflareError]]:
+        """Create several DNS records concurrently.
+
+        At most ``max_concurrency`` requests are in flight at once.
+
+        Args:
+            records: DNS records to create.
+
+        Returns:
+            The API response for each record, or the CloudflareError it failed with,
+            in the same order as ``records``.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def create(record: DNSRecord) -> Union[Dict, CloudflareError]:
+            async with semaphore:
+                try:
+                    return await self.create_dns_record(record)
+                except CloudflareError as e:
+                    return e
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    return CloudflareError(f"Request failed: {e!r}")
+
+        return list(await asyncio.gather(*(create(record) for record in records)))
+
+    async def filter_unregistered(self, names: Sequence[str]) -> List[str]:
+        """Return the names that do not resolve in DNS yet, looking them up concurrently.
+
+        Raises:
+            socket.gaierror: If a lookup failed for a reason other than the name
+                not existing, such as an unreachable resolver.
+        """
+        return await _filter_unregistered(names)
+
+    async def list_dns_records(self, params: Optional[Dict] = None) -> List[Dict]:
+        """List all DNS records for the zone."""
+        return [record async for record in self.iter_dns_records(params)]
+
+    async def iter_dns_records(self, params: Optional[Dict] = None) -> AsyncIterator[Dict]:
+        """Iterate over all DNS records for the zone, fetching one page at a time."""
+        url = f"{self.base_url}/zones/{self.config.zone_id}/dns_records"
+        page, total_pages = 1, 1
+        while page <= total_pages:
+            page_params = {"per_page": _DNS_RECORDS_PAGE_SIZE, **(params or {}), "page": page}
+            data = await self._request("GET", url, params=page_params)
+            for record in data["result"]:
+                yield record
+            total_pages = data.get("result_info", {}).get("total_pages", 1)
+            page += 1
+
+    async def delete_dns_record(self, record_id: str) -> Dict:
+        """Delete a DNS record by ID."""
+        if len(record_id) > 32:
+            raise ValueError("record_id must not exceed 32 characters")
+
+        url = f"{self.base_url}/zones/{self.config.zone_id}/dns_records/{record_id}"
+        return await self._request("DELETE", url)
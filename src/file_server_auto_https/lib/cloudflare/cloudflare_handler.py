@@ -1,14 +1,56 @@
 """Cloudflare API handler module."""
+import asyncio
 import os
-from typing import Optional, Dict, List, Any
+import socket
+import time
+from functools import lru_cache
+from typing import Optional, Dict, Iterator, List, Any, Sequence, Union
+import secrets
 import string
-import random
+import orjson
 import requests
-from pydantic import BaseModel, Field, field_validator
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+try:
+    import httpx
+    import h2  # noqa: F401  # needed by httpx for HTTP/2
+except ImportError:
+    httpx = None
+
+_SUBDOMAIN_ALPHABET = string.ascii_letters + string.digits
+# Maps random bytes onto the alphabet. Bytes from 248 up (past the largest multiple
+# of 62 that fits in a byte) are dropped so every character stays equally likely.
+_SUBDOMAIN_TABLE = bytes(ord(_SUBDOMAIN_ALPHABET[i % len(_SUBDOMAIN_ALPHABET)]) for i in range(256))
+_SUBDOMAIN_REJECT = bytes(range(256 - 256 % len(_SUBDOMAIN_ALPHABET), 256))
+
+# CloudflareConfig field -> environment variable
+_CONFIG_ENV_VARS = {
+    "email": "CLOUDFLARE_EMAIL",
+    "api_key": "CLOUDFLARE_API_KEY",
+    "zone_id": "CLOUDFLARE_ZONE_ID",
+    "base_domain": "BASE_DOMAIN"
+}
+
+# Shared, never mutated: payloads are only ever serialized
+_DEFAULT_RECORD_SETTINGS = {"ipv4_only": False, "ipv6_only": False}
+
+# Large pages keep the number of list round trips low on busy zones
+_DNS_RECORDS_PAGE_SIZE = 5000
+
+# getaddrinfo errors meaning the name has no records (EAI_NODATA is not defined everywhere)
+_UNREGISTERED_ERRNOS = {socket.EAI_NONAME, getattr(socket, "EAI_NODATA", socket.EAI_NONAME)}
+
+# Retry policy shared by the requests and httpx backends
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.3
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Creates in flight at once during bulk creation; keeps large batches clear of rate limits
+_BULK_CREATE_CONCURRENCY = 20
 
 class CloudflareError(Exception):
     """Custom exception for Cloudflare API errors."""
@@ -18,6 +60,8 @@ class CloudflareError(Exception):
 
 class CloudflareConfig(BaseModel):
     """Cloudflare API configuration."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     email: str = Field(..., description="Cloudflare account email")
     api_key: str = Field(..., description="Cloudflare API key")
     zone_id: str = Field(..., description="Zone ID for the domain")
@@ -32,11 +76,15 @@ class CloudflareConfig(BaseModel):
 
 class DNSRecordSettings(BaseModel):
     """DNS record settings."""
+    model_config = ConfigDict(frozen=True)
+
     ipv4_only: bool = False
     ipv6_only: bool = False
 
 class DNSRecord(BaseModel):
     """DNS record model."""
+    model_config = ConfigDict(frozen=True)
+
     name: str
     type: str = "A"
     content: str
@@ -67,81 +115,213 @@ class DNSRecord(BaseModel):
             raise ValueError("ttl must be 1 (automatic) or between 60 and 86400 seconds")
         return v
 
+@lru_cache(maxsize=1)
+def get_cloudflare_config() -> CloudflareConfig:
+    """Load Cloudflare configuration from environment variables and .env.
+
+    The result is cached, so the .env file is parsed and validated once per process.
+    Parsing is skipped entirely when the environment already provides every variable.
+    """
+    env = os.environ
+    if not all(env.get(env_var) for env_var in _CONFIG_ENV_VARS.values()):
+        load_dotenv(override=False)
+
+    config_data = {key: env.get(env_var) for key, env_var in _CONFIG_ENV_VARS.items()}
+    missing_vars = [env_var for key, env_var in _CONFIG_ENV_VARS.items() if not config_data[key]]
+
+    if missing_vars:
+        raise ValueError(f"Missing required environment variables: {', '.join(missing_vars)}")
+    
+    return CloudflareConfig(**config_data)
+
+def _record_payload(record: DNSRecord) -> Dict:
+    """Build the API request body for a DNS record."""
+    record_data = record.model_dump(exclude_none=True)
+    # Add default settings if not provided
+    record_data.setdefault("settings", _DEFAULT_RECORD_SETTINGS)
+    return record_data
+
+def _check_result(data: Dict, ok: bool, status: str) -> Dict:
+    """Raise CloudflareError for failed API calls, otherwise return the payload."""
+    if not ok:
+        message = status
+        if data.get("errors"):
+            message = f"{message}: {data['errors']}"
+        raise CloudflareError(message, data.get("errors"))
+
+    if not data.get("success"):
+        raise CloudflareError("API request was not successful", data.get("errors"))
+
+    return data
+
+def _should_retry(method: str, status_code: int) -> bool:
+    """Return whether a response is worth retrying.
+
+    Creates are only repeated on 429: Cloudflare may already have applied a
+    create that failed with a server error, but never a rate-limited one.
+    """
+    if method == "POST":
+        return status_code == 429
+    return method in ("GET", "DELETE") and status_code in _RETRY_STATUSES
+
+def _retry_delay(attempt: int, retry_after: Optional[str]) -> float:
+    """Seconds to wait before retrying, honouring a Retry-After header in seconds."""
+    if retry_after and retry_after.isdigit():
+        return float(retry_after)
+    return _RETRY_BACKOFF * 2 ** attempt
+
+class _CloudflareRetry(Retry):
+    """urllib3 retry policy for the requests backend, following _should_retry.
+
+    POST is left out of ``allowed_methods``, so creates are not retried after read
+    errors. Connection failures (nothing was sent) are retried for every method.
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        """Retry responses according to the shared policy."""
+        return _should_retry(method, status_code)
+
+if httpx is not None:
+    class _RetryTransport(httpx.BaseTransport):
+        """httpx transport retrying responses according to _should_retry.
+
+        httpx itself only retries failed connection attempts.
+        """
+
+        def __init__(self, transport: httpx.BaseTransport):
+            self._transport = transport
+
+        def handle_request(self, request: httpx.Request) -> httpx.Response:
+            """Send the request, retrying rate limits and server errors with backoff."""
+            for attempt in range(_RETRY_TOTAL):
+                response = self._transport.handle_request(request)
+                if not _should_retry(request.method, response.status_code):
+                    return response
+                response.close()
+                time.sleep(_retry_delay(attempt, response.headers.get("Retry-After")))
+            return self._transport.handle_request(request)
+
+        def close(self) -> None:
+            """Close the wrapped transport."""
+            self._transport.close()
+
 class CloudflareClient:
     """Client for interacting with Cloudflare API."""
     
-    def __init__(self, config: Optional[CloudflareConfig] = None):
-        """Initialize the client with config or load from environment."""
-        self.config = config or self._load_config()
+    def __init__(self, config: Optional[CloudflareConfig] = None, http2: Optional[bool] = None):
+        """Initialize the client with config or load from environment.
+
+        Args:
+            config: Cloudflare configuration. Loaded from environment if not provided.
+            http2: Use httpx over HTTP/2 instead of requests. Defaults to True when
+                the ``http2`` extra is installed.
+        """
+        self.config = config or get_cloudflare_config()
         self.base_url = "https://api.cloudflare.com/client/v4"
+        self.timeout = 10.0
+        # Short-lived cache of list_dns_records results, cleared on every write
+        self._list_cache: TTLCache = TTLCache(maxsize=32, ttl=30)
         self.headers = {
             "X-Auth-Email": self.config.email,
             "X-Auth-Key": self.config.api_key,
             "Content-Type": "application/json"
         }
+        self.http2 = httpx is not None if http2 is None else http2
+        if self.http2 and httpx is None:
+            raise ImportError(
+                "HTTP/2 support requires the http2 extra: "
+                "pip install 'file-server-auto-https[http2]'"
+            )
+        # One pooled keep-alive session so consecutive calls skip the TCP/TLS handshake
+        if self.http2:
+            # httpx only retries failed connection attempts; error responses are retried on top
+            transport = _RetryTransport(httpx.HTTPTransport(http2=True, retries=_RETRY_TOTAL))
+            self._session = httpx.Client(transport=transport, headers=self.headers, timeout=self.timeout)
+        else:
+            # Retry transient failures on the pooled connection instead of surfacing them
+            retries = _CloudflareRetry(
+                total=_RETRY_TOTAL,
+                backoff_factor=_RETRY_BACKOFF,
+                status_forcelist=sorted(_RETRY_STATUSES),
+                allowed_methods=["GET", "DELETE"],
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+            self._session = requests.Session()
+            self._session.headers.update(self.headers)
+            self._session.mount(
+                "https://",
+                HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retries)
+            )
 
-    @staticmethod
-    def _load_config() -> CloudflareConfig:
-        """Load configuration from environment variables."""
-        required_vars = {
-            "email": "CLOUDFLARE_EMAIL",
-            "api_key": "CLOUDFLARE_API_KEY",
-            "zone_id": "CLOUDFLARE_ZONE_ID",
-            "base_domain": "BASE_DOMAIN"
-        }
-        
-        config_data = {}
-        missing_vars = []
-        
-        for key, env_var in required_vars.items():
-            value = os.getenv(env_var)
-            if not value:
-                missing_vars.append(env_var)
-            config_data[key] = value
-        
-        if missing_vars:
-            raise ValueError(f"Missing required environment variables: {', '.join(missing_vars)}")
-        
-        return CloudflareConfig(**config_data)
+    def close(self) -> None:
+        """Close the underlying HTTP session."""
+        self._session.close()
+
+    def __enter__(self) -> 'CloudflareClient':
+        """Return the client for use as a context manager."""
+        return self
 
-    def _handle_response(self, response: requests.Response) -> Dict:
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Close the HTTP session when exiting a context."""
+        self.close()
+
+    def _handle_response(self, response: "requests.Response | httpx.Response") -> Dict:
         """Handle API response and raise appropriate errors."""
         try:
-            data = response.json()
+            data = orjson.loads(response.content)
         except ValueError:
             raise CloudflareError(f"Invalid JSON response: {response.text}")
 
-        if not response.ok:
-            message = f"{response.status_code} {response.reason}"
-            if data.get("errors"):
-                message = f"{message}: {data['errors']}"
-            raise CloudflareError(message, data.get("errors"))
+        if httpx is not None and isinstance(response, httpx.Response):
+            ok, reason = response.is_success, response.reason_phrase
+        else:
+            ok, reason = response.ok, response.reason
 
-        if not data.get("success"):
-            raise CloudflareError("API request was not successful", data.get("errors"))
+        return _check_result(data, ok, f"{response.status_code} {reason}")
 
-        return data
+    def _post_json(self, url: str, payload: Dict) -> "requests.Response | httpx.Response":
+        """POST a payload serialized with orjson."""
+        body = orjson.dumps(payload)
+        if self.http2:
+            return self._session.post(url, content=body, timeout=self.timeout)
+        return self._session.post(url, data=body, timeout=self.timeout)
 
     def create_dns_record(self, record: DNSRecord) -> Dict:
         """Create a new DNS record."""
         url = f"{self.base_url}/zones/{self.config.zone_id}/dns_records"
         
-        # Prepare the record data
-        record_data = record.model_dump(exclude_none=True)
-        
-        # Add default settings if not provided
-        if "settings" not in record_data:
-            record_data["settings"] = {"ipv4_only": False, "ipv6_only": False}
-            
-        response = requests.post(url, headers=self.headers, json=record_data)
-        return self._handle_response(response)
+        response = self._post_json(url, _record_payload(record))
+        data = self._handle_response(response)
+        self._list_cache.clear()
+        return data
 
     def list_dns_records(self, params: Optional[Dict] = None) -> List[Dict]:
-        """List DNS records for the zone."""
+        """List DNS records for the zone.
+
+        Results are cached for a short time and invalidated by create/delete calls.
+        Queries with list-valued params (repeated query keys) are not cached.
+        """
+        params = params or {}
+        try:
+            key = (self.config.zone_id, frozenset(params.items()))
+        except TypeError:
+            return list(self.iter_dns_records(params))
+        if key not in self._list_cache:
+            self._list_cache[key] = list(self.iter_dns_records(params))
+        return list(self._list_cache[key])
+
+    def iter_dns_records(self, params: Optional[Dict] = None) -> Iterator[Dict]:
+        """Iterate over all DNS records for the zone, fetching one page at a time."""
         url = f"{self.base_url}/zones/{self.config.zone_id}/dns_records"
-        response = requests.get(url, headers=self.headers, params=params or {})
-        data = self._handle_response(response)
-        return data["result"]
+        page, total_pages = 1, 1
+        while page <= total_pages:
+            page_params = {"per_page": _DNS_RECORDS_PAGE_SIZE, **(params or {}), "page": page}
+            response = self._session.get(url, params=page_params, timeout=self.timeout)
+            data = self._handle_response(response)
+            yield from data["result"]
+            total_pages = data.get("result_info", {}).get("total_pages", 1)
+            page += 1
 
     def delete_dns_record(self, record_id: str) -> Dict:
         """Delete a DNS record by ID."""
@@ -149,8 +329,132 @@ class CloudflareClient:
             raise ValueError("record_id must not exceed 32 characters")
             
         url = f"{self.base_url}/zones/{self.config.zone_id}/dns_records/{record_id}"
-        response = requests.delete(url, headers=self.headers)
-        return self._handle_response(response)
+        response = self._session.delete(url, timeout=self.timeout)
+        data = self._handle_response(response)
+        self._list_cache.clear()
+        return data
+
+    def bulk_create_dns_records(self, records: Sequence[DNSRecord]) -> List[Union[Dict, CloudflareError]]:
+        """Create several DNS records at once.
+
+        Up to 20 requests are in flight at once: over a single multiplexed
+        connection when the client uses HTTP/2, otherwise through
+        AsyncCloudflareClient when the async extra is installed. Without either,
+        records are created one after another on the pooled session. Must not be
+        called from a running event loop.
+
+        Args:
+            records: DNS records to create.
+
+        Returns:
+            The API response for each record, or the CloudflareError it failed with,
+            in the same order as ``records``.
+        """
+        results: List[Union[Dict, CloudflareError]]
+        async_client_cls = None if self.http2 else _async_client_class()
+        if self.http2:
+            results = asyncio.run(self._bulk_create_http2(records))
+        elif async_client_cls is not None:
+            results = asyncio.run(self._bulk_create_async(async_client_cls, records))
+        else:
+            results = []
+            for record in records:
+                try:
+                    results.append(self.create_dns_record(record))
+                except CloudflareError as e:
+                    results.append(e)
+                except requests.RequestException as e:
+                    results.append(CloudflareError(f"Request failed: {e}"))
+
+        self._list_cache.clear()
+        return results
+
+    def filter_unregistered(self, names: Sequence[str]) -> List[str]:
+        """Return the names that do not resolve in DNS yet.
+
+        All names are looked up concurrently. Must not be called from a running
+        event loop.
+
+        Args:
+            names: Fully qualified domain names to check.
+
+        Returns:
+            The names without any address record, in their original order.
+
+        Raises:
+            socket.gaierror: If a lookup failed for a reason other than the name
+                not existing, such as an unreachable resolver.
+        """
+        return asyncio.run(_filter_unregistered(names))
+
+    async def _bulk_create_async(
+        self,
+        async_client_cls: type,
+        records: Sequence[DNSRecord]
+    ) -> List[Union[Dict, CloudflareError]]:
+        """Send the create requests concurrently through AsyncCloudflareClient."""
+        async with async_client_cls(self.config, max_concurrency=_BULK_CREATE_CONCURRENCY) as client:
+            client.base_url = self.base_url
+            return await client.create_dns_records(records)
+
+    async def _bulk_create_http2(self, records: Sequence[DNSRecord]) -> List[Union[Dict, CloudflareError]]:
+        """Send the create requests concurrently over one HTTP/2 connection."""
+        url = f"{self.base_url}/zones/{self.config.zone_id}/dns_records"
+        semaphore = asyncio.Semaphore(_BULK_CREATE_CONCURRENCY)
+
+        async with httpx.AsyncClient(http2=True, headers=self.headers, timeout=self.timeout) as client:
+            async def post(record: DNSRecord) -> httpx.Response:
+                body = orjson.dumps(_record_payload(record))
+                async with semaphore:
+                    for attempt in range(_RETRY_TOTAL):
+                        response = await client.post(url, content=body)
+                        if not _should_retry("POST", response.status_code):
+                            return response
+                        await asyncio.sleep(_retry_delay(attempt, response.headers.get("Retry-After")))
+                    return await client.post(url, content=body)
+
+            responses = await asyncio.gather(*(post(r) for r in records), return_exceptions=True)
+
+        results: List[Union[Dict, CloudflareError]] = []
+        for response in responses:
+            if isinstance(response, Exception):
+                results.append(CloudflareError(f"Request failed: {response}"))
+                continue
+            try:
+                results.append(self._handle_response(response))
+            except CloudflareError as e:
+                results.append(e)
+        return results
+
+def _async_client_class() -> Optional[type]:
+    """Return AsyncCloudflareClient, or None when the async extra is missing."""
+    try:
+        from .async_handler import AsyncCloudflareClient
+    except ImportError:
+        return None
+    return AsyncCloudflareClient
+
+async def _resolves(name: str) -> bool:
+    """Return whether a name currently resolves to any address.
+
+    Only a definite "no such name" answer counts as unresolved; other lookup
+    failures (e.g. a resolver outage) are raised so a taken name is never
+    reported as free.
+    """
+    try:
+        await asyncio.get_running_loop().getaddrinfo(name, None)
+    except socket.gaierror as e:
+        if e.errno in _UNREGISTERED_ERRNOS:
+            return False
+        raise
+    except UnicodeError:
+        return False
+    return True
+
+async def _filter_unregistered(names: Sequence[str]) -> List[str]:
+    """Look up all names concurrently and keep those that do not resolve."""
+    resolved = await asyncio.gather(*(_resolves(name) for name in names))
+    return [name for name, is_live in zip(names, resolved) if not is_live]
 
 def generate_subdomain(length: int = 8) -> str:
     """Generate a random subdomain with mixed case letters and numbers.
@@ -161,5 +465,7 @@ def generate_subdomain(length: int = 8) -> str:
     Returns:
         A random string of specified length containing mixed case letters and numbers.
     """
-    characters = string.ascii_letters + string.digits
-    return ''.join(random.choice(characters) for _ in range(length))
+    subdomain = b""
+    while len(subdomain) < length:
+        subdomain += secrets.token_bytes(length).translate(_SUBDOMAIN_TABLE, _SUBDOMAIN_REJECT)
+    return subdomain[:length].decode()
@@ -1,40 +1,95 @@
 """Module for detecting machine's IP addresses."""
+import queue
 import socket
+import threading
 import requests
 import json
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Optional
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
 
+# The public IP rarely changes while the server runs; avoid re-probing for 5 minutes.
+# Only successful lookups are stored so a transient outage is retried on the next call.
+_public_ip_cache: TTLCache = TTLCache(maxsize=1, ttl=300)
+_public_ip_lock = threading.Lock()
+
+# Shared keep-alive session: repeated probes skip the TCP/TLS handshake.
+# No retries: every attempt gets its own timeout, so retrying would stretch a probe
+# past _PROBE_TIMEOUT when the network is down. The other services are the fallback.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=10,
+    max_retries=0
+))
+
+# Seconds each probe may wait to connect and again to read; the probes run
+# concurrently, so this also bounds the whole lookup
+_PROBE_TIMEOUT = 5
+
+_PUBLIC_IP_SERVICES = [
+    ("https://api.ipify.org", lambda r: r.text.strip()),
+    ("https://api.myip.com", lambda r: json.loads(r.text)["ip"]),
+    ("https://ifconfig.me/ip", lambda r: r.text.strip())
+]
+
+@lru_cache(maxsize=1)
 def get_local_ip() -> str:
     """Get the local IP address of the machine."""
     s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     try:
-        # Doesn't need to be reachable
+        # Doesn't need to be reachable: connecting a UDP socket sends no packet,
+        # it only makes the kernel pick the outbound interface's address
         s.connect(('10.255.255.255', 1))
         ip = s.getsockname()[0]
-    except Exception:
+    except OSError:
         ip = '127.0.0.1'
     finally:
         s.close()
     return ip
 
-def get_public_ip() -> Optional[str]:
-    """Get the public IP address of the machine using external services."""
-    services = [
-        ("https://api.ipify.org", lambda r: r.text.strip()),
-        ("https://api.myip.com", lambda r: json.loads(r.text)["ip"]),
-        ("https://ifconfig.me/ip", lambda r: r.text.strip())
-    ]
-    
-    for url, parser in services:
-        try:
-            response = requests.get(url, timeout=5)
-            if response.status_code == 200:
-                return parser(response)
-        except (requests.RequestException, json.JSONDecodeError, KeyError):
-            continue
-    
+def _probe_public_ip(url: str, parser: Callable[[requests.Response], str]) -> Optional[str]:
+    """Query a single IP echo service, returning None on any failure."""
+    try:
+        response = _SESSION.get(url, timeout=_PROBE_TIMEOUT)
+        if response.status_code == 200:
+            return parser(response)
+    except (requests.RequestException, json.JSONDecodeError, KeyError):
+        pass
     return None
 
+def _query_public_ip() -> Optional[str]:
+    """Query all services concurrently and return the first successful answer."""
+    results: "queue.Queue[Optional[str]]" = queue.Queue()
+    for url, parser in _PUBLIC_IP_SERVICES:
+        # Daemon threads so a hanging service never delays interpreter exit
+        threading.Thread(
+            target=lambda u=url, p=parser: results.put(_probe_public_ip(u, p)),
+            daemon=True
+        ).start()
+
+    for _ in _PUBLIC_IP_SERVICES:
+        ip = results.get()
+        if ip:
+            return ip
+
+    return None
+
+def get_public_ip() -> Optional[str]:
+    """Get the public IP address of the machine using external services.
+
+    All services are queried concurrently and the first successful answer wins.
+    Successful results are cached for five minutes.
+    """
+    with _public_ip_lock:
+        ip = _public_ip_cache.get("ip")
+        if ip is None:
+            ip = _query_public_ip()
+            if ip:
+                _public_ip_cache["ip"] = ip
+    return ip
+
 def get_ip(use_public: bool = True) -> str:
     """Get IP address based on preference.
     
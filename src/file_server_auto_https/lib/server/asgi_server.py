@@ -0,0 +1,93 @@
+"""ASGI file server module built on uvicorn and Starlette."""
+import threading
+import time
+from pathlib import Path
+from typing import Union
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.routing import Mount
+from starlette.staticfiles import StaticFiles
+
+from .file_server import FileServer, console
+
+class AsgiFileServer(FileServer):
+    """File server running on a single asyncio event loop instead of a thread per connection.
+
+    Directory listings are not generated; directories are served through
+    their ``index.html`` when one exists.
+    """
+
+    def __init__(self, directory: Union[str, Path], host: str = "0.0.0.0", port: int = 8000):
+        """Initialize the file server.
+
+        Args:
+            directory: Root directory to serve files from
+            host: Host to bind to (default: "0.0.0.0")
+            port: Port to listen on (default: 8000)
+        """
+        super().__init__(directory, host=host, port=port)
+
+    def _create_app(self) -> Starlette:
+        """Create the ASGI application serving our directory."""
+        return Starlette(
+            routes=[Mount("/", app=StaticFiles(directory=self.directory, html=True))],
+            middleware=[Middleware(CORSMiddleware, allow_origins=["*"])]
+        )
+
+    def _run(self) -> None:
+        """Run uvicorn, ending the thread quietly if it fails to start."""
+        try:
+            self._server.run()
+        except SystemExit:
+            # uvicorn exits on startup failures (e.g. port in use); start() reports them
+            pass
+
+    def start(self) -> None:
+        """Start the file server in a background thread."""
+        if self._server:
+            raise RuntimeError("Server is already running")
+
+        config = uvicorn.Config(self._create_app(), host=self.host, port=self.port)
+        self._server = uvicorn.Server(config)
+
+        # Start the server in a background thread
+        self._server_thread = threading.Thread(target=self._run, daemon=True)
+        self._server_thread.start()
+
+        # Wait until the socket is bound so callers can connect right away
+        while not self._server.started:
+            if not self._server_thread.is_alive():
+                self._server = None
+                self._server_thread = None
+                raise RuntimeError(f"Failed to start server on {self.host}:{self.port}")
+            time.sleep(0.01)
+
+        console.print(
+            f"[green]Server started![/green]\n"
+            f"Serving directory: [bold]{self.directory}[/bold]\n"
+            f"URL: [bold]http://{self.host}:{self.server_port}/[/bold]"
+        )
+
+    def stop(self) -> None:
+        """Stop the file server."""
+        if self._server:
+            self._server.should_exit = True
+            self._server_thread.join()
+            self._server = None
+            self._server_thread = None
+            console.print("[yellow]Server stopped[/yellow]")
+
+    @property
+    def server_port(self) -> int:
+        """Port the running server is bound to, which differs from ``port`` when that is 0."""
+        if not self._server:
+            raise RuntimeError("Server is not running")
+        return self._server.servers[0].sockets[0].getsockname()[1]
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the server is running."""
+        return bool(self._server and self._server.started and self._server_thread.is_alive())
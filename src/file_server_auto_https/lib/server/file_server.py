@@ -1,31 +1,97 @@
 """Simple HTTP file server module."""
+import html
+import io
 import os
+import queue
 import socket
+import sys
 import threading
+import time
+import urllib.parse
 from pathlib import Path
 from typing import Optional, Union
+from http import HTTPStatus
 from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
-from functools import partial
+from functools import lru_cache, partial
 import mimetypes
 from rich.console import Console
 
 console = Console()
 
+# Register MIME types once at import instead of for every request
+if not mimetypes.inited:
+    mimetypes.init()
+# Add common video formats
+mimetypes.add_type('video/mp4', '.mp4')
+mimetypes.add_type('video/webm', '.webm')
+mimetypes.add_type('video/ogg', '.ogv')
+
+# Seconds a pooled connection may take to send its request before it is dropped
+_POOL_IDLE_TIMEOUT = 30
+
+# Listings are only cached once the directory's mtime is this far in the past.
+# Coarse timestamps (2 s on FAT, 1 s on HFS+) leave the mtime unchanged when a file
+# is added in the same step, which would otherwise serve a stale page indefinitely.
+_LISTING_SETTLE_NS = 2_000_000_000
+
+@lru_cache(maxsize=128)
+def _render_directory_listing(path: str, displaypath: str, mtime_ns: int) -> bytes:
+    """Render the HTML listing for a directory.
+
+    Entries come from os.scandir, whose file types are known without a stat
+    call per entry. mtime_ns is part of the cache key, so adding, removing or
+    renaming an entry produces a fresh page.
+    """
+    with os.scandir(path) as it:
+        entries = sorted(it, key=lambda entry: entry.name.lower())
+
+    displaypath = html.escape(displaypath, quote=False)
+    enc = sys.getfilesystemencoding()
+    title = f'Directory listing for {displaypath}'
+    r = [
+        '<!DOCTYPE HTML>',
+        '<html lang="en">',
+        '<head>',
+        f'<meta charset="{enc}">',
+        f'<title>{title}</title>\n</head>',
+        f'<body>\n<h1>{title}</h1>',
+        '<hr>\n<ul>',
+    ]
+    for entry in entries:
+        displayname = linkname = entry.name
+        # Append / for directories or @ for symbolic links
+        if entry.is_dir():
+            displayname = entry.name + "/"
+            linkname = entry.name + "/"
+        if entry.is_symlink():
+            displayname = entry.name + "@"
+        r.append('<li><a href="%s">%s</a></li>'
+                 % (urllib.parse.quote(linkname, errors='surrogatepass'),
+                    html.escape(displayname, quote=False)))
+    r.append('</ul>\n<hr>\n</body>\n</html>\n')
+    return '\n'.join(r).encode(enc, 'surrogateescape')
+
 class EnhancedHTTPRequestHandler(SimpleHTTPRequestHandler):
     """Enhanced request handler with better MIME type support and logging."""
+
+    # Set TCP_NODELAY so small responses aren't held back by Nagle's algorithm
+    disable_nagle_algorithm = True
     
-    def __init__(self, *args, directory: Optional[str] = None, **kwargs):
-        """Initialize the handler with optional root directory."""
-        # Ensure proper MIME type detection
-        if not mimetypes.inited:
-            mimetypes.init()
-        # Add common video formats
-        mimetypes.add_type('video/mp4', '.mp4')
-        mimetypes.add_type('video/webm', '.webm')
-        mimetypes.add_type('video/ogg', '.ogv')
-        
-        super().__init__(*args, directory=directory, **kwargs)
-    
+    def handle_one_request(self) -> None:
+        """Apply the server's idle timeout, if any, while waiting for the next request."""
+        self.connection.settimeout(getattr(self.server, "idle_timeout", None))
+        super().handle_one_request()
+
+    def parse_request(self) -> bool:
+        """Parse the request, then lift the idle timeout for the response.
+
+        A client may legitimately stop reading mid-download (e.g. a paused
+        video), so only the wait for the request itself is bounded.
+        """
+        ok = super().parse_request()
+        self.connection.settimeout(None)
+        return ok
+
     def log_message(self, format: str, *args) -> None:
         """Override logging to use rich console."""
         console.print(f"[dim]{self.address_string()}[/dim] - {format%args}")
@@ -35,6 +101,102 @@ class EnhancedHTTPRequestHandler(SimpleHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Origin', '*')
         super().end_headers()
 
+    def list_directory(self, path: str) -> Optional[io.BytesIO]:
+        """Produce a directory listing, reusing the rendered page until the directory changes."""
+        try:
+            displaypath = urllib.parse.unquote(self.path, errors='surrogatepass')
+        except UnicodeDecodeError:
+            displaypath = urllib.parse.unquote(self.path)
+
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+            render = _render_directory_listing
+            if time.time_ns() - mtime_ns < _LISTING_SETTLE_NS:
+                # The directory may change again without its mtime moving
+                render = _render_directory_listing.__wrapped__
+            encoded = render(path, displaypath, mtime_ns)
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, "No permission to list directory")
+            return None
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-type", f"text/html; charset={sys.getfilesystemencoding()}")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        return io.BytesIO(encoded)
+
+    def copyfile(self, source, outputfile) -> None:
+        """Send the body with socket.sendfile so file data never passes through user space.
+
+        socket.sendfile uses sendfile(2) for regular files and falls back to
+        plain sends by itself for anything else (e.g. rendered listings).
+        """
+        # Headers may still sit in the writer's buffer
+        outputfile.flush()
+        self.connection.sendfile(source, source.tell())
+
+class FileHTTPServer(ThreadingHTTPServer):
+    """Threading HTTP server that can optionally share its port with other processes.
+
+    By default every connection gets its own daemon thread. With ``max_workers``
+    set, connections are instead queued for a fixed pool of reused daemon threads.
+    """
+
+    def __init__(
+        self,
+        server_address,
+        handler_class,
+        reuse_port: bool = False,
+        max_workers: Optional[int] = None
+    ):
+        """Initialize the server, binding with SO_REUSEPORT if requested."""
+        self.reuse_port = reuse_port
+        self.max_workers = max_workers
+        # Pooled workers are scarce, so connections that never send a request are dropped
+        self.idle_timeout = _POOL_IDLE_TIMEOUT if max_workers else None
+        self._requests: Optional[queue.Queue] = None
+        super().__init__(server_address, handler_class)
+
+        if max_workers:
+            self._requests = queue.Queue()
+            for i in range(max_workers):
+                threading.Thread(target=self._worker, name=f"file-server-{i}", daemon=True).start()
+
+    def _worker(self) -> None:
+        """Handle queued requests until the server is closed."""
+        while True:
+            item = self._requests.get()
+            if item is None:
+                return
+            self.process_request_thread(*item)
+
+    def process_request(self, request, client_address) -> None:
+        """Hand the request to the worker pool, or to a new thread without one."""
+        if self._requests is None:
+            super().process_request(request, client_address)
+        else:
+            self._requests.put((request, client_address))
+
+    def server_close(self) -> None:
+        """Close the listening socket, drop queued requests and stop the workers."""
+        super().server_close()
+        if self._requests is not None:
+            while True:
+                try:
+                    item = self._requests.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    self.shutdown_request(item[0])
+            for _ in range(self.max_workers):
+                self._requests.put(None)
+
+    def server_bind(self) -> None:
+        """Enable SO_REUSEPORT before binding so several processes can accept on one port."""
+        if self.reuse_port and hasattr(socket, "SO_REUSEPORT"):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
 class FileServer:
     """HTTP file server that can be started and stopped."""
     
@@ -43,7 +205,9 @@ class FileServer:
         directory: Union[str, Path],
         host: str = "0.0.0.0",
         port: int = 8000,
-        directory_listing: bool = True
+        directory_listing: bool = True,
+        reuse_port: bool = False,
+        max_workers: Optional[int] = None
     ):
         """Initialize the file server.
         
@@ -52,12 +216,18 @@ class FileServer:
             host: Host to bind to (default: "0.0.0.0")
             port: Port to listen on (default: 8000)
             directory_listing: Whether to allow directory listing (default: True)
+            reuse_port: Bind with SO_REUSEPORT so several server processes can
+                share the port, with the kernel balancing connections (default: False)
+            max_workers: Handle requests on a fixed pool of this many threads
+                instead of one thread per connection (default: None)
         """
         self.directory = str(Path(directory).resolve())
         self.host = host
         self.port = port
         self.directory_listing = directory_listing
-        self._server: Optional[ThreadingHTTPServer] = None
+        self.reuse_port = reuse_port
+        self.max_workers = max_workers
+        self._server: Optional[FileHTTPServer] = None
         self._server_thread: Optional[threading.Thread] = None
     
     def _create_handler(self) -> type[SimpleHTTPRequestHandler]:
@@ -78,7 +248,12 @@ class FileServer:
         
         # Create and configure the server
         handler = self._create_handler()
-        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server = FileHTTPServer(
+            (self.host, self.port),
+            handler,
+            reuse_port=self.reuse_port,
+            max_workers=self.max_workers
+        )
         
         # Start the server in a background thread
         self._server_thread = threading.Thread(
@@ -87,13 +262,10 @@ class FileServer:
         )
         self._server_thread.start()
         
-        # Get the actual port (in case we used port 0)
-        actual_port = self._server.server_port
-        
         console.print(
             f"[green]Server started![/green]\n"
             f"Serving directory: [bold]{self.directory}[/bold]\n"
-            f"URL: [bold]http://{self.host}:{actual_port}/[/bold]"
+            f"URL: [bold]http://{self.host}:{self.server_port}/[/bold]"
         )
     
     def stop(self) -> None:
@@ -105,6 +277,13 @@ class FileServer:
             self._server_thread = None
             console.print("[yellow]Server stopped[/yellow]")
     
+    @property
+    def server_port(self) -> int:
+        """Port the running server is bound to, which differs from ``port`` when that is 0."""
+        if not self._server:
+            raise RuntimeError("Server is not running")
+        return self._server.server_port
+
     @property
     def is_running(self) -> bool:
         """Check if the server is running."""
@@ -123,17 +302,28 @@ def find_free_port(start_port: int = 8000, max_tries: int = 100) -> Optional[int
     """Find a free port starting from start_port.
     
     Args:
-        start_port: Port to start searching from
+        start_port: Port to start searching from. Use 0 to let the OS pick any free port.
         max_tries: Maximum number of ports to try
     
     Returns:
         A free port number or None if no free port was found
     """
-    for port in range(start_port, start_port + max_tries):
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        if start_port <= 0:
+            # A single bind to port 0 lets the kernel hand out a free ephemeral port
+            s.bind(('', 0))
+            return s.getsockname()[1]
+
+        # Match the server's SO_REUSEADDR so ports lingering in TIME_WAIT count as free.
+        # On Windows the option lets bind() succeed on a port that is already listening,
+        # so it is left off there.
+        # A failed bind leaves the socket unbound, so one socket serves every attempt.
+        if os.name != "nt":
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        for port in range(start_port, start_port + max_tries):
+            try:
                 s.bind(('', port))
                 return port
-        except OSError:
-            continue
+            except OSError:
+                continue
     return None 
\ No newline at end of file
@@ -0,0 +1,24 @@
+"""Shared pytest fixtures."""
+from unittest.mock import MagicMock
+
+import pytest
+
+from file_server_auto_https.lib.cloudflare.cloudflare_handler import get_cloudflare_config
+
+@pytest.fixture
+def cloudflare_env(monkeypatch):
+    """Fixture providing Cloudflare settings through the environment instead of .env."""
+    monkeypatch.setenv("CLOUDFLARE_EMAIL", "test@example.com")
+    monkeypatch.setenv("CLOUDFLARE_API_KEY", "test-key")
+    monkeypatch.setenv("CLOUDFLARE_ZONE_ID", "test-zone")
+    monkeypatch.setenv("BASE_DOMAIN", "example.com")
+    get_cloudflare_config.cache_clear()
+    yield
+    get_cloudflare_config.cache_clear()
+
+@pytest.fixture
+def fake_socket(monkeypatch):
+    """Fixture replacing socket.socket with a single MagicMock for the whole test."""
+    mock_socket = MagicMock()
+    monkeypatch.setattr("socket.socket", mock_socket)
+    return mock_socket
@@ -0,0 +1,72 @@
+"""Tests for the ASGI file server."""
+import socket
+import urllib.error
+import urllib.request
+
+import pytest
+
+pytest.importorskip("uvicorn")
+pytest.importorskip("starlette")
+
+from file_server_auto_https.lib.server.asgi_server import AsgiFileServer
+
+@pytest.fixture
+def served_dir(tmp_path):
+    """Fixture for a directory with a file and a subdirectory with an index page."""
+    (tmp_path / "notes.txt").write_text("hello")
+    (tmp_path / "site").mkdir()
+    (tmp_path / "site" / "index.html").write_text("<h1>site</h1>")
+    return tmp_path
+
+def _get(server: AsgiFileServer, path: str):
+    """Fetch a path from a running server."""
+    url = f"http://127.0.0.1:{server.server_port}/{path}"
+    return urllib.request.urlopen(url, timeout=5)
+
+def test_serves_files_on_os_assigned_port(served_dir):
+    """Test that port 0 is reported through server_port and files are served."""
+    with AsgiFileServer(served_dir, host="127.0.0.1", port=0) as server:
+        assert server.is_running
+        assert server.server_port > 0
+        response = _get(server, "notes.txt")
+        assert response.read() == b"hello"
+        assert _get(server, "site/").read() == b"<h1>site</h1>"
+
+def test_cors_headers(served_dir):
+    """Test that cross-origin requests are allowed."""
+    with AsgiFileServer(served_dir, host="127.0.0.1", port=0) as server:
+        request = urllib.request.Request(
+            f"http://127.0.0.1:{server.server_port}/notes.txt",
+            headers={"Origin": "https://sub.example.com"}
+        )
+        response = urllib.request.urlopen(request, timeout=5)
+        assert response.headers["Access-Control-Allow-Origin"] == "*"
+
+def test_no_directory_listing(served_dir):
+    """Test that directories without an index page are not listed."""
+    with AsgiFileServer(served_dir, host="127.0.0.1", port=0) as server:
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            _get(server, "")
+        assert exc_info.value.code == 404
+
+def test_bind_failure(served_dir):
+    """Test that a port already in use raises RuntimeError."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as busy:
+        busy.bind(("127.0.0.1", 0))
+        busy.listen()
+        server = AsgiFileServer(served_dir, host="127.0.0.1", port=busy.getsockname()[1])
+        with pytest.raises(RuntimeError):
+            server.start()
+        assert not server.is_running
+
+def test_stop(served_dir):
+    """Test that stopping releases the server and its port."""
+    server = AsgiFileServer(served_dir, host="127.0.0.1", port=0)
+    server.start()
+    port = server.server_port
+    server.stop()
+    assert not server.is_running
+    with pytest.raises(RuntimeError):
+        server.server_port
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", port))
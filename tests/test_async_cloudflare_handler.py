@@ -0,0 +1,138 @@
+"""Tests for the asynchronous Cloudflare client."""
+import asyncio
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from file_server_auto_https.lib.cloudflare.cloudflare_handler import (
+    CloudflareConfig,
+    CloudflareError,
+    DNSRecord
+)
+from file_server_auto_https.lib.cloudflare.async_handler import AsyncCloudflareClient
+
+@pytest.fixture
+def mock_config():
+    """Fixture for mock Cloudflare configuration."""
+    return CloudflareConfig(
+        email="test@example.com",
+        api_key="test-key",
+        zone_id="test-zone",
+        base_domain="example.com"
+    )
+
+async def _create_records(config, names, status=200, batch=False):
+    """Create records against a local stand-in for the Cloudflare API."""
+    async def handler(request):
+        assert request.content_type == "application/json"
+        body = await request.json()
+        if status != 200:
+            return web.json_response(
+                {"success": False, "errors": [{"code": 1000, "message": "API Error"}]},
+                status=status
+            )
+        return web.json_response({"success": True, "result": {"id": body["name"], **body}})
+
+    app = web.Application()
+    app.router.add_post("/zones/{zone_id}/dns_records", handler)
+    async with TestServer(app) as server:
+        async with AsyncCloudflareClient(config) as client:
+            client.base_url = str(server.make_url("")).rstrip("/")
+            records = [DNSRecord(name=name, content="1.1.1.1") for name in names]
+            if batch:
+                return await client.create_dns_records(records)
+            return await asyncio.gather(*(client.create_dns_record(r) for r in records))
+
+def test_create_dns_records_concurrently(mock_config):
+    """Test creating several DNS records concurrently."""
+    names = [f"sub{i}.example.com" for i in range(5)]
+    results = asyncio.run(_create_records(mock_config, names))
+    assert [r["result"]["id"] for r in results] == names
+    assert all(r["result"]["settings"] == {"ipv4_only": False, "ipv6_only": False} for r in results)
+
+def test_create_dns_record_error(mock_config):
+    """Test error handling in the asynchronous client."""
+    with pytest.raises(CloudflareError) as exc_info:
+        asyncio.run(_create_records(mock_config, ["test.example.com"], status=400))
+    assert "400 Bad Request" in str(exc_info.value)
+
+def test_create_dns_records_batch(mock_config):
+    """Test batch creation returns results in order and reports failures per record."""
+    names = [f"sub{i}.example.com" for i in range(30)]
+    results = asyncio.run(_create_records(mock_config, names, batch=True))
+    assert [r["result"]["id"] for r in results] == names
+
+    results = asyncio.run(_create_records(mock_config, names[:2], status=400, batch=True))
+    assert all(isinstance(r, CloudflareError) for r in results)
+
+def test_create_dns_records_limits_concurrency(mock_config):
+    """Test that batch creation keeps at most max_concurrency requests in flight."""
+    in_flight = peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return web.json_response({"success": True, "result": {"id": (await request.json())["name"]}})
+
+    async def create_records():
+        app = web.Application()
+        app.router.add_post("/zones/{zone_id}/dns_records", handler)
+        async with TestServer(app) as server:
+            async with AsyncCloudflareClient(mock_config, max_concurrency=3) as client:
+                client.base_url = str(server.make_url("")).rstrip("/")
+                records = [DNSRecord(name=f"sub{i}.example.com", content="1.1.1.1") for i in range(10)]
+                return await client.create_dns_records(records)
+
+    assert len(asyncio.run(create_records())) == 10
+    assert peak == 3
+
+def test_rate_limited_create_is_retried(mock_config, monkeypatch):
+    """Test that the async client retries rate limits but not server errors on create."""
+    monkeypatch.setattr("file_server_auto_https.lib.cloudflare.cloudflare_handler._RETRY_BACKOFF", 0)
+    statuses = {"limited.example.com": [429, 200], "broken.example.com": [502, 200]}
+
+    async def handler(request):
+        name = (await request.json())["name"]
+        status = statuses[name].pop(0)
+        if status != 200:
+            return web.json_response({"success": False, "errors": []}, status=status)
+        return web.json_response({"success": True, "result": {"id": name}})
+
+    async def create_records():
+        app = web.Application()
+        app.router.add_post("/zones/{zone_id}/dns_records", handler)
+        async with TestServer(app) as server:
+            async with AsyncCloudflareClient(mock_config) as client:
+                client.base_url = str(server.make_url("")).rstrip("/")
+                records = [DNSRecord(name=name, content="1.1.1.1") for name in statuses]
+                return await client.create_dns_records(records)
+
+    limited, broken = asyncio.run(create_records())
+    assert limited["result"]["id"] == "limited.example.com"
+    assert isinstance(broken, CloudflareError)
+    assert statuses == {"limited.example.com": [], "broken.example.com": [200]}
+
+def test_list_dns_records_follows_pages(mock_config):
+    """Test that every page of records is fetched."""
+    async def handler(request):
+        page = int(request.query["page"])
+        return web.json_response({
+            "success": True,
+            "result": [{"id": f"p{page}"}],
+            "result_info": {"page": page, "total_pages": 3}
+        })
+
+    async def list_records():
+        app = web.Application()
+        app.router.add_get("/zones/{zone_id}/dns_records", handler)
+        async with TestServer(app) as server:
+            async with AsyncCloudflareClient(mock_config) as client:
+                client.base_url = str(server.make_url("")).rstrip("/")
+                return await client.list_dns_records()
+
+    assert asyncio.run(list_records()) == [{"id": "p1"}, {"id": "p2"}, {"id": "p3"}]
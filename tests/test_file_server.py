@@ -0,0 +1,134 @@
+"""Tests for the HTTP file server."""
+import os
+import socket
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from file_server_auto_https.lib.server import file_server
+from file_server_auto_https.lib.server.file_server import FileServer, find_free_port
+
+@pytest.fixture
+def served_dir(tmp_path):
+    """Fixture for a directory with a multi-megabyte file and a small one."""
+    (tmp_path / "video.mp4").write_bytes(bytes(range(256)) * 8192)
+    (tmp_path / "notes.txt").write_text("hello")
+    return tmp_path
+
+def _get(server: FileServer, path: str):
+    """Fetch a path from a running server."""
+    url = f"http://127.0.0.1:{server.server_port}/{path}"
+    return urllib.request.urlopen(url, timeout=5)
+
+def test_serves_large_file(served_dir):
+    """Test that files are transferred completely with the right MIME type."""
+    with FileServer(served_dir, host="127.0.0.1", port=0) as server:
+        response = _get(server, "video.mp4")
+        assert response.headers["Content-Type"] == "video/mp4"
+        assert response.headers["Access-Control-Allow-Origin"] == "*"
+        assert response.read() == (served_dir / "video.mp4").read_bytes()
+
+def test_requests_use_bounded_worker_pool(served_dir):
+    """Test that concurrent requests are served by a fixed set of daemon threads."""
+    with FileServer(served_dir, host="127.0.0.1", port=0, max_workers=2) as server:
+        with ThreadPoolExecutor(max_workers=8) as clients:
+            bodies = list(clients.map(lambda _: _get(server, "notes.txt").read(), range(16)))
+        assert bodies == [b"hello"] * 16
+        workers = [t for t in threading.enumerate() if t.name.startswith("file-server-")]
+        assert len(workers) == 2
+        assert all(t.daemon for t in workers)
+
+def test_idle_connections_release_workers(served_dir, monkeypatch):
+    """Test that idle clients time out instead of holding pool workers."""
+    monkeypatch.setattr(file_server, "_POOL_IDLE_TIMEOUT", 0.2)
+    with FileServer(served_dir, host="127.0.0.1", port=0, max_workers=1) as server:
+        with socket.create_connection(("127.0.0.1", server.server_port)):
+            assert _get(server, "notes.txt").read() == b"hello"
+
+def test_paused_download_is_not_cut_off(tmp_path, monkeypatch):
+    """Test that the idle timeout doesn't apply once the response is being sent."""
+    (tmp_path / "big.bin").write_bytes(b"x" * (32 * 1024 * 1024))
+    monkeypatch.setattr(file_server, "_POOL_IDLE_TIMEOUT", 0.2)
+    with FileServer(tmp_path, host="127.0.0.1", port=0, max_workers=1) as server:
+        with socket.create_connection(("127.0.0.1", server.server_port)) as client:
+            client.sendall(b"GET /big.bin HTTP/1.0\r\n\r\n")
+            time.sleep(1)
+            received = b"".join(iter(lambda: client.recv(1024 * 1024), b""))
+    assert received.endswith(b"\r\n\r\n" + b"x" * (32 * 1024 * 1024))
+
+def test_directory_listing_disabled(served_dir):
+    """Test that directory listing can be disabled."""
+    with FileServer(served_dir, host="127.0.0.1", port=0, directory_listing=False) as server:
+        assert _get(server, "notes.txt").read() == b"hello"
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            _get(server, "")
+        assert exc_info.value.code == 403
+
+def test_directory_listing(served_dir):
+    """Test that listings show entries and pick up new files."""
+    (served_dir / "docs").mkdir()
+    with FileServer(served_dir, host="127.0.0.1", port=0) as server:
+        listing = _get(server, "").read().decode()
+        assert '<a href="docs/">docs/</a>' in listing
+        assert '<a href="notes.txt">notes.txt</a>' in listing
+
+        (served_dir / "new.txt").write_text("new")
+        assert "new.txt" in _get(server, "").read().decode()
+
+def test_directory_listing_coarse_mtime(served_dir):
+    """Test that a recent directory mtime is not trusted to detect new files."""
+    with FileServer(served_dir, host="127.0.0.1", port=0) as server:
+        stamp = os.stat(served_dir).st_mtime_ns
+        assert "new.txt" not in _get(server, "").read().decode()
+
+        # Simulate a coarse-timestamp filesystem: the mtime doesn't move
+        (served_dir / "new.txt").write_text("new")
+        os.utime(served_dir, ns=(stamp, stamp))
+        assert "new.txt" in _get(server, "").read().decode()
+
+def test_directory_listing_cached_once_settled(served_dir):
+    """Test that listings of directories unchanged for a while are reused."""
+    settled = time.time_ns() - 60 * 10**9
+    os.utime(served_dir, ns=(settled, settled))
+    with FileServer(served_dir, host="127.0.0.1", port=0) as server:
+        assert "new.txt" not in _get(server, "").read().decode()
+
+        (served_dir / "new.txt").write_text("new")
+        os.utime(served_dir, ns=(settled, settled))
+        assert "new.txt" not in _get(server, "").read().decode()
+
+@pytest.mark.skipif(not hasattr(socket, "SO_REUSEPORT"), reason="SO_REUSEPORT not supported")
+def test_reuse_port(served_dir):
+    """Test that two servers can share a port when reuse_port is enabled."""
+    with FileServer(served_dir, host="127.0.0.1", port=0, reuse_port=True) as first:
+        port = first.server_port
+        with FileServer(served_dir, host="127.0.0.1", port=port, reuse_port=True) as second:
+            assert second.server_port == port
+            assert _get(second, "notes.txt").read() == b"hello"
+
+def test_find_free_port(fake_socket):
+    """Test that busy ports are skipped using a single probe socket."""
+    fake_socket.return_value.__enter__.return_value.bind.side_effect = [OSError, OSError, None]
+    assert find_free_port(8000) == 8002
+    assert fake_socket.call_count == 1
+
+def test_find_free_port_no_reuseaddr_on_windows(fake_socket, monkeypatch):
+    """Test that SO_REUSEADDR is not set on Windows, where it hides busy ports."""
+    monkeypatch.setattr("file_server_auto_https.lib.server.file_server.os.name", "nt")
+    assert find_free_port(8000) == 8000
+    fake_socket.return_value.__enter__.return_value.setsockopt.assert_not_called()
+
+def test_find_free_port_exhausted(fake_socket):
+    """Test that None is returned when every port is busy."""
+    fake_socket.return_value.__enter__.return_value.bind.side_effect = OSError
+    assert find_free_port(8000, max_tries=3) is None
+
+def test_find_free_port_os_assigned():
+    """Test that port 0 asks the OS for a free port."""
+    port = find_free_port(0)
+    assert 0 < port < 65536
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(('', port))
@@ -1,16 +1,37 @@
 """Tests for DNS record generation functionality."""
+import asyncio
 import pytest
-from unittest.mock import patch, MagicMock
+from functools import partial
+from http import HTTPStatus
+from unittest.mock import DEFAULT, patch, Mock
 import re
+import socket
+import sys
+import orjson
+import requests
 
 from file_server_auto_https.lib.cloudflare.cloudflare_handler import (
     CloudflareClient,
     CloudflareConfig,
     DNSRecord,
     CloudflareError,
-    generate_subdomain
+    generate_subdomain,
+    get_cloudflare_config
 )
 
+_SUBDOMAIN_RE = re.compile(r'^[a-zA-Z0-9]+$')
+
+def _json_response(payload, status=200):
+    """Build a fake requests.Response whose body is the given payload."""
+    content = payload if isinstance(payload, bytes) else orjson.dumps(payload)
+    response = Mock(spec=requests.Response)
+    response.ok = status < 400
+    response.status_code = status
+    response.reason = HTTPStatus(status).phrase
+    response.content = content
+    response.text = content.decode()
+    return response
+
 @pytest.fixture
 def mock_config():
     """Fixture for mock Cloudflare configuration."""
@@ -39,20 +60,12 @@ def mock_success_response():
 @pytest.fixture
 def mock_client(mock_config, mock_success_response):
     """Fixture for mock Cloudflare client."""
-    with patch('requests.post') as mock_post, \
-         patch('requests.get') as mock_get, \
-         patch('requests.delete') as mock_delete:
-        
+    with patch.multiple(requests.Session, post=DEFAULT, get=DEFAULT, delete=DEFAULT) as mocks:
         # Configure mock responses
-        mock_response = MagicMock()
-        mock_response.json.return_value = mock_success_response
-        mock_response.ok = True
-        
-        mock_post.return_value = mock_response
-        mock_get.return_value = mock_response
-        mock_delete.return_value = mock_response
+        for mock_method in mocks.values():
+            mock_method.return_value = _json_response(mock_success_response)
         
-        client = CloudflareClient(mock_config)
+        client = CloudflareClient(mock_config, http2=False)
         yield client
 
 def test_generate_subdomain_length():
@@ -63,9 +76,9 @@ def test_generate_subdomain_length():
 
 def test_generate_subdomain_characters():
     """Test that generated subdomains contain valid characters."""
-    subdomain = generate_subdomain()
     # Should only contain letters and numbers
-    assert re.match(r'^[a-zA-Z0-9]+$', subdomain) is not None
+    for _ in range(100):
+        assert _SUBDOMAIN_RE.match(generate_subdomain()) is not None
 
 def test_generate_subdomain_uniqueness():
     """Test that generated subdomains are unique."""
@@ -90,17 +103,12 @@ def test_create_dns_record(mock_client, mock_success_response):
 
 def test_create_dns_record_error(mock_client):
     """Test error handling when creating a DNS record."""
-    with patch('requests.post') as mock_post:
+    with patch('requests.Session.post') as mock_post:
         # Configure mock to return an error response
-        mock_response = MagicMock()
-        mock_response.ok = False
-        mock_response.status_code = 400
-        mock_response.reason = "Bad Request"
-        mock_response.json.return_value = {
+        mock_post.return_value = _json_response({
             "success": False,
             "errors": [{"code": 1000, "message": "API Error"}]
-        }
-        mock_post.return_value = mock_response
+        }, status=400)
         
         record = DNSRecord(
             name="test.example.com",
@@ -114,15 +122,12 @@ def test_create_dns_record_error(mock_client):
 
 def test_list_dns_records(mock_client, mock_success_response):
     """Test listing DNS records."""
-    with patch('requests.get') as mock_get:
+    with patch('requests.Session.get') as mock_get:
         # Configure mock to return a list of records
-        mock_response = MagicMock()
-        mock_response.ok = True
-        mock_response.json.return_value = {
+        mock_get.return_value = _json_response({
             "success": True,
             "result": [mock_success_response["result"]]
-        }
-        mock_get.return_value = mock_response
+        })
         
         records = mock_client.list_dns_records()
         assert isinstance(records, list)
@@ -165,3 +170,276 @@ def test_dns_record_validation():
             name="test.example.com",
             content=""
         )
+
+def test_client_context_manager_closes_session(mock_config):
+    """Test that the client closes its HTTP session when used as a context manager."""
+    with patch('requests.Session.close') as mock_close:
+        with CloudflareClient(mock_config, http2=False) as client:
+            assert isinstance(client, CloudflareClient)
+        mock_close.assert_called_once()
+
+def test_create_dns_record_http2(mock_config, mock_success_response):
+    """Test creating a DNS record through the HTTP/2 backend."""
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+
+    def handler(request):
+        assert request.headers["X-Auth-Email"] == "test@example.com"
+        return httpx.Response(200, json=mock_success_response)
+
+    with CloudflareClient(mock_config, http2=True) as client:
+        client._session.close()
+        client._session = httpx.Client(
+            transport=httpx.MockTransport(handler),
+            headers=client.headers
+        )
+        record = DNSRecord(name="test.example.com", content="1.1.1.1")
+        assert client.create_dns_record(record) == mock_success_response
+
+def test_get_cloudflare_config_is_cached(cloudflare_env):
+    """Test that configuration is loaded from the environment once, without parsing .env."""
+    with patch('file_server_auto_https.lib.cloudflare.cloudflare_handler.load_dotenv') as mock_load:
+        config = get_cloudflare_config()
+        assert config.base_domain == "example.com"
+        assert get_cloudflare_config() is config
+        mock_load.assert_not_called()
+
+def test_get_cloudflare_config_missing_vars(monkeypatch):
+    """Test that missing environment variables are reported."""
+    for var in ("CLOUDFLARE_EMAIL", "CLOUDFLARE_API_KEY", "CLOUDFLARE_ZONE_ID", "BASE_DOMAIN"):
+        monkeypatch.delenv(var, raising=False)
+    monkeypatch.setattr(
+        "file_server_auto_https.lib.cloudflare.cloudflare_handler.load_dotenv",
+        lambda override: None
+    )
+    get_cloudflare_config.cache_clear()
+    with pytest.raises(ValueError) as exc_info:
+        get_cloudflare_config()
+    assert "CLOUDFLARE_EMAIL" in str(exc_info.value)
+
+def test_list_dns_records_cached(mock_client, mock_success_response):
+    """Test that listing is cached until a record is created."""
+    with patch('requests.Session.get') as mock_get:
+        mock_get.return_value = _json_response({
+            "success": True,
+            "result": [mock_success_response["result"]]
+        })
+
+        assert mock_client.list_dns_records() == mock_client.list_dns_records()
+        assert mock_get.call_count == 1
+
+        mock_client.create_dns_record(DNSRecord(name="new.example.com", content="1.1.1.1"))
+        mock_client.list_dns_records()
+        assert mock_get.call_count == 2
+
+def test_list_dns_records_list_params(mock_client, mock_success_response):
+    """Test that list-valued params are passed through uncached."""
+    with patch('requests.Session.get') as mock_get:
+        mock_get.return_value = _json_response({
+            "success": True,
+            "result": [mock_success_response["result"]]
+        })
+
+        params = {"type": ["A", "AAAA"]}
+        assert mock_client.list_dns_records(params) == [mock_success_response["result"]]
+        mock_client.list_dns_records(params)
+        assert mock_get.call_count == 2
+        assert mock_get.call_args.kwargs["params"]["type"] == ["A", "AAAA"]
+
+def test_models_are_frozen(mock_config):
+    """Test that the shared configuration cannot be mutated."""
+    with pytest.raises(ValueError):
+        mock_config.zone_id = "other-zone"
+    with pytest.raises(ValueError):
+        CloudflareConfig(**mock_config.model_dump(), account_id="typo")
+
+def test_iter_dns_records_pagination(mock_client, mock_success_response):
+    """Test that all pages of DNS records are fetched."""
+    with patch('requests.Session.get') as mock_get:
+        mock_get.side_effect = [
+            _json_response({
+                "success": True,
+                "result": [{**mock_success_response["result"], "id": f"id-{page}"}],
+                "result_info": {"page": page, "total_pages": 2}
+            })
+            for page in (1, 2)
+        ]
+
+        records = list(mock_client.iter_dns_records())
+        assert [r["id"] for r in records] == ["id-1", "id-2"]
+        assert mock_get.call_args.kwargs["params"]["page"] == 2
+
+def test_invalid_json_response(mock_client):
+    """Test that non-JSON responses raise CloudflareError."""
+    with patch('requests.Session.delete') as mock_delete:
+        mock_delete.return_value = _json_response(b"<html>Bad Gateway</html>", status=502)
+
+        with pytest.raises(CloudflareError) as exc_info:
+            mock_client.delete_dns_record("test-id")
+        assert "Invalid JSON response" in str(exc_info.value)
+
+def test_session_retries_transient_errors(mock_client):
+    """Test that the session retries rate limits and server errors."""
+    retries = mock_client._session.get_adapter(mock_client.base_url).max_retries
+    assert retries.total == 3
+    assert {429, 503}.issubset(retries.status_forcelist)
+    assert retries.is_retry("GET", 503)
+    # Creates are only retried when Cloudflare certainly did not apply them
+    assert retries.is_retry("POST", 429)
+    assert not retries.is_retry("POST", 502)
+    assert "POST" not in retries.allowed_methods
+    assert not retries.new(total=2).is_retry("POST", 503)
+
+def test_http2_client_retries_transient_errors(mock_config, mock_success_response, monkeypatch):
+    """Test that the HTTP/2 backend applies the same retry policy as the requests one."""
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+    statuses = {"GET": [503, 200], "POST": [429, 200], "DELETE": [502, 200]}
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        status = statuses[request.method].pop(0)
+        if status != 200:
+            return httpx.Response(status, json={"success": False, "errors": []})
+        return httpx.Response(200, json={**mock_success_response, "result": [mock_success_response["result"]]})
+
+    monkeypatch.setattr(httpx, "HTTPTransport", lambda **kwargs: httpx.MockTransport(handler))
+    monkeypatch.setattr("file_server_auto_https.lib.cloudflare.cloudflare_handler._RETRY_BACKOFF", 0)
+    with CloudflareClient(mock_config, http2=True) as client:
+        assert len(client.list_dns_records()) == 1
+        client.create_dns_record(DNSRecord(name="test.example.com", content="1.1.1.1"))
+        client.delete_dns_record("test-id")
+        assert calls == ["GET", "GET", "POST", "POST", "DELETE", "DELETE"]
+
+        # A create that may already have been applied is not repeated
+        statuses["POST"] = [502]
+        with pytest.raises(CloudflareError):
+            client.create_dns_record(DNSRecord(name="test.example.com", content="1.1.1.1"))
+        assert calls.count("POST") == 3
+
+def test_bulk_create_dns_records_http2(mock_config, mock_success_response, monkeypatch):
+    """Test that bulk creation sends all records and reports failures per record."""
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+
+    def handler(request):
+        if orjson.loads(request.content)["name"] == "bad.example.com":
+            return httpx.Response(400, json={"success": False, "errors": [{"code": 1000, "message": "API Error"}]})
+        return httpx.Response(200, json=mock_success_response)
+
+    monkeypatch.setattr(httpx, "AsyncClient", partial(httpx.AsyncClient, transport=httpx.MockTransport(handler)))
+    records = [
+        DNSRecord(name="good.example.com", content="1.1.1.1"),
+        DNSRecord(name="bad.example.com", content="1.1.1.1")
+    ]
+    with CloudflareClient(mock_config, http2=True) as client:
+        results = client.bulk_create_dns_records(records)
+
+    assert results[0] == mock_success_response
+    assert isinstance(results[1], CloudflareError)
+    assert "400 Bad Request" in str(results[1])
+
+def test_bulk_create_dns_records_limits_concurrency(mock_config, mock_success_response, monkeypatch):
+    """Test that bulk creation caps the number of requests in flight."""
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+
+    in_flight = peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json=mock_success_response)
+
+    monkeypatch.setattr(httpx, "AsyncClient", partial(httpx.AsyncClient, transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr("file_server_auto_https.lib.cloudflare.cloudflare_handler._BULK_CREATE_CONCURRENCY", 3)
+    records = [DNSRecord(name=f"sub{i}.example.com", content="1.1.1.1") for i in range(10)]
+    with CloudflareClient(mock_config, http2=True) as client:
+        assert client.bulk_create_dns_records(records) == [mock_success_response] * 10
+    assert peak == 3
+
+def test_bulk_create_dns_records_retries_rate_limits(mock_config, mock_success_response, monkeypatch):
+    """Test that bulk creation over HTTP/2 retries rate-limited creates only."""
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+    statuses = {"limited.example.com": [429, 200], "broken.example.com": [502, 200]}
+
+    def handler(request):
+        status = statuses[orjson.loads(request.content)["name"]].pop(0)
+        if status != 200:
+            return httpx.Response(status, json={"success": False, "errors": []})
+        return httpx.Response(200, json=mock_success_response)
+
+    monkeypatch.setattr(httpx, "AsyncClient", partial(httpx.AsyncClient, transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr("file_server_auto_https.lib.cloudflare.cloudflare_handler._RETRY_BACKOFF", 0)
+    records = [DNSRecord(name=name, content="1.1.1.1") for name in statuses]
+    with CloudflareClient(mock_config, http2=True) as client:
+        limited, broken = client.bulk_create_dns_records(records)
+
+    assert limited == mock_success_response
+    assert isinstance(broken, CloudflareError)
+    assert statuses == {"limited.example.com": [], "broken.example.com": [200]}
+
+@pytest.fixture
+def without_async_extra(monkeypatch):
+    """Fixture hiding the aiohttp-based client, as if the async extra were not installed."""
+    monkeypatch.setitem(sys.modules, "file_server_auto_https.lib.cloudflare.async_handler", None)
+
+def test_bulk_create_dns_records_async(mock_client, mock_success_response):
+    """Test that bulk creation without HTTP/2 goes through the bounded async client."""
+    async_handler = pytest.importorskip("file_server_auto_https.lib.cloudflare.async_handler")
+    records = [DNSRecord(name=f"sub{i}.example.com", content="1.1.1.1") for i in range(3)]
+    with patch.object(
+        async_handler.AsyncCloudflareClient,
+        "create_dns_records",
+        autospec=True,
+        return_value=[mock_success_response] * 3
+    ) as mock_create:
+        assert mock_client.bulk_create_dns_records(records) == [mock_success_response] * 3
+
+    async_client, sent = mock_create.call_args.args
+    assert sent == records
+    assert async_client.base_url == mock_client.base_url
+    assert async_client.max_concurrency == 20
+    requests.Session.post.assert_not_called()
+
+def test_bulk_create_dns_records_sequential(mock_client, mock_success_response, without_async_extra):
+    """Test that bulk creation sends requests one by one without HTTP/2 or aiohttp."""
+    records = [DNSRecord(name=f"sub{i}.example.com", content="1.1.1.1") for i in range(3)]
+    assert mock_client.bulk_create_dns_records(records) == [mock_success_response] * 3
+    assert requests.Session.post.call_count == 3
+
+def test_bulk_create_dns_records_sequential_connection_error(mock_client, mock_success_response, without_async_extra):
+    """Test that a network error on one record doesn't discard the others' results."""
+    requests.Session.post.side_effect = [
+        requests.Session.post.return_value,
+        requests.ConnectionError("connection reset"),
+        requests.Session.post.return_value
+    ]
+    records = [DNSRecord(name=f"sub{i}.example.com", content="1.1.1.1") for i in range(3)]
+    results = mock_client.bulk_create_dns_records(records)
+    assert results[0] == results[2] == mock_success_response
+    assert isinstance(results[1], CloudflareError)
+    assert "connection reset" in str(results[1])
+
+def test_filter_unregistered(mock_client):
+    """Test that only names without DNS records are returned."""
+    def fake_getaddrinfo(host, *args, **kwargs):
+        if host.startswith("live"):
+            return [(2, 1, 6, "", ("1.1.1.1", 0))]
+        raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+
+    names = ["free1.example.com", "live.example.com", "free2.example.com"]
+    with patch("socket.getaddrinfo", side_effect=fake_getaddrinfo):
+        assert mock_client.filter_unregistered(names) == ["free1.example.com", "free2.example.com"]
+
+def test_filter_unregistered_resolver_failure(mock_client):
+    """Test that a failing resolver is reported instead of marking names as free."""
+    error = socket.gaierror(socket.EAI_AGAIN, "Temporary failure in name resolution")
+    with patch("socket.getaddrinfo", side_effect=error):
+        with pytest.raises(socket.gaierror):
+            mock_client.filter_unregistered(["taken.example.com"])
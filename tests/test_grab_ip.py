@@ -0,0 +1,80 @@
+"""Tests for IP address detection."""
+import time
+from unittest.mock import patch, MagicMock
+
+import pytest
+import requests
+
+from file_server_auto_https.lib import grab_ip
+
+@pytest.fixture(autouse=True)
+def clear_ip_caches():
+    """Reset cached lookups so each test probes again."""
+    grab_ip._public_ip_cache.clear()
+    grab_ip.get_local_ip.cache_clear()
+    yield
+    grab_ip._public_ip_cache.clear()
+    grab_ip.get_local_ip.cache_clear()
+
+def _fake_get(delays, failing=()):
+    """Build a fake session.get answering each service after a delay."""
+    def fake_get(url, timeout):
+        for service, delay in delays.items():
+            if service in url:
+                time.sleep(delay)
+        if any(service in url for service in failing):
+            raise requests.ConnectionError(url)
+        response = MagicMock(status_code=200)
+        response.text = '{"ip": "3.3.3.3"}' if "myip" in url else f"{url.split('/')[2]}\n"
+        return response
+    return fake_get
+
+def test_get_local_ip(fake_socket):
+    """Test that the outbound interface address is read from a UDP socket."""
+    fake_socket.return_value.getsockname.return_value = ("192.168.1.2", 54321)
+    assert grab_ip.get_local_ip() == "192.168.1.2"
+    fake_socket.return_value.close.assert_called_once()
+
+def test_get_local_ip_without_network(fake_socket):
+    """Test the loopback fallback when no route is available."""
+    fake_socket.return_value.connect.side_effect = OSError("Network is unreachable")
+    assert grab_ip.get_local_ip() == "127.0.0.1"
+
+def test_get_public_ip_returns_fastest_answer():
+    """Test that the first successful service wins."""
+    fake_get = _fake_get({"ipify": 1.0, "myip": 1.0, "ifconfig": 0.0})
+    with patch.object(grab_ip._SESSION, "get", side_effect=fake_get):
+        start = time.monotonic()
+        assert grab_ip.get_public_ip() == "ifconfig.me"
+        assert time.monotonic() - start < 0.5
+
+def test_get_public_ip_skips_failures():
+    """Test that failing services are ignored."""
+    fake_get = _fake_get({"myip": 0.1}, failing=("ipify", "ifconfig"))
+    with patch.object(grab_ip._SESSION, "get", side_effect=fake_get):
+        assert grab_ip.get_public_ip() == "3.3.3.3"
+
+def test_get_public_ip_caches_only_successes():
+    """Test that failed lookups are retried while successful ones are cached."""
+    failing = _fake_get({}, failing=("ipify", "myip", "ifconfig"))
+    with patch.object(grab_ip._SESSION, "get", side_effect=failing):
+        assert grab_ip.get_public_ip() is None
+
+    working = _fake_get({"ipify": 1.0, "myip": 1.0})
+    with patch.object(grab_ip._SESSION, "get", side_effect=working) as get:
+        assert grab_ip.get_public_ip() == "ifconfig.me"
+        calls = get.call_count
+        assert grab_ip.get_public_ip() == "ifconfig.me"
+        assert get.call_count == calls
+
+def test_probe_session_does_not_retry():
+    """Test that a probe makes a single attempt, so its timeout bounds it."""
+    adapter = grab_ip._SESSION.get_adapter("https://api.ipify.org")
+    assert adapter.max_retries.total == 0
+
+def test_get_ip_falls_back_to_local_ip():
+    """Test that the local IP is used when no service answers."""
+    fake_get = _fake_get({}, failing=("ipify", "myip", "ifconfig"))
+    with patch.object(grab_ip._SESSION, "get", side_effect=fake_get), \
+         patch.object(grab_ip, "get_local_ip", return_value="192.168.1.2"):
+        assert grab_ip.get_ip() == "192.168.1.2"
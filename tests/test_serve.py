@@ -0,0 +1,36 @@
+"""Tests for the serve command."""
+import sys
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from file_server_auto_https.cmd.server.serve import app
+
+runner = CliRunner()
+
+@pytest.mark.parametrize("flags", [
+    ["--no-directory-listing"],
+    ["--reuse-port"],
+    ["--workers", "4"],
+    ["--reuse-port", "--workers", "4"],
+])
+def test_asgi_rejects_threaded_server_flags(tmp_path, flags):
+    """Test that flags the ASGI server cannot honour are refused before any DNS work."""
+    with patch("file_server_auto_https.lib.cloudflare.cloudflare_handler.CloudflareClient") as mock_client:
+        result = runner.invoke(app, [str(tmp_path), "--asgi", *flags])
+    assert result.exit_code == 1
+    assert "cannot be combined with --asgi" in result.output
+    for flag in flags:
+        if flag.startswith("--"):
+            assert flag in result.output
+    mock_client.assert_not_called()
+
+def test_asgi_without_extra_creates_no_dns_record(tmp_path, monkeypatch):
+    """Test that a missing asgi extra is reported before a DNS record is created."""
+    monkeypatch.setitem(sys.modules, "file_server_auto_https.lib.server.asgi_server", None)
+    with patch("file_server_auto_https.lib.cloudflare.cloudflare_handler.CloudflareClient") as mock_client:
+        result = runner.invoke(app, [str(tmp_path), "--asgi"])
+    assert result.exit_code == 1
+    assert "asgi extra" in result.output
+    mock_client.assert_not_called()